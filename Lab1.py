@@ -7,10 +7,10 @@ of the user's laptop to closely resemble real network communication. Due to sand
 it uses an internal queue instead of real network sockets and threading.
 
 Layers Implemented:
-1. Physical Layer - Simulates data transmission using an internal queue.
+1. Physical Layer - Simulates data transmission using an internal deque.
 2. Data Link Layer - Dynamically retrieves and incorporates the laptop's real MAC address.
 3. Network Layer - Dynamically retrieves and uses the laptop's actual local IP address for realistic packet headers.
-4. Transport Layer - Adds sequencing headers to ensure ordered data transmission.
+4. Transport Layer - Adds sequencing headers (sequence number and payload length) to ensure ordered, complete delivery.
 5. Session Layer - Manages session states for client-server communication.
 6. Presentation Layer - Handles Base64 encoding and decoding of messages.
 7. Application Layer - Implements a simplified request-response system for placing food orders.
@@ -18,126 +18,202 @@ Layers Implemented:
 How it Works:
 - A customer places an order at the Application Layer.
 - The order moves through the layers, receiving realistic MAC and IP addresses, sequencing, encoding, and framing.
+- Each layer prepends a fixed-width binary header (packed with struct) and strips it again on receive.
 - The Physical Layer transmits the order via the mocked queue.
-- The server-side response (confirmation) travels back up through the layers to the Application Layer.
+- From the Transport Layer down, each layer passes its header alongside the payload instead of
+  concatenating; the Physical Layer joins them, so the payload is copied once rather than once per layer.
+- The server-side response (confirmation) travels back up through the layers to the Application Layer;
+  each layer strips its header with a zero-copy memoryview slice.
 - The Application Layer displays the confirmation message.
 
 Constraints Met:
 - No external networking libraries.
-- Uses only standard Python libraries.
+- Uses only standard Python libraries (pybase64 and orjson are used when installed).
 - Fully simulates OSI communication with real network identifiers without actual sockets or threads.
 
 Run the program to simulate an order from "Al Glenrey" ordering "Pizza."
 """
 
-import queue
-import base64
+import binascii
+import collections
+import functools
 import json
-import time
 import socket
+import struct
 import uuid
 
+try:
+    from pybase64 import b64encode as _b64encode, b64decode as _b64decode
+except ImportError:
+    _b64encode = functools.partial(binascii.b2a_base64, newline=False)
+    _b64decode = binascii.a2b_base64
+
+try:
+    from orjson import dumps as _dumps
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode()
+
+MAC_HEADER = struct.Struct('!6s')
+IP_HEADER = struct.Struct('!4s4s')
+# Sequence number, payload length.
+SEGMENT_HEADER = struct.Struct('!II')
+
+_CONF_PREFIX = b"CONFIRMATION|"
+_CONF_LEN = len(_CONF_PREFIX)
+
+# Per-layer trace output; payload formatting is skipped entirely when off.
+_DEBUG = False
+
 def print_layer(layer_name, message):
     print(f"[{layer_name}] {message}\n")
 
+def _format_frame(headers, payload):
+    # Binary headers as hex, the (base64) payload as text: "02fc...|c000...|00000001...|eyJ..."
+    return "|".join([*(bytes(h).hex() for h in headers), bytes(payload).decode('ascii', 'backslashreplace')])
+
+def _format_raw_frame(frame):
+    headers = []
+    offset = 0
+    for header in (MAC_HEADER, IP_HEADER, SEGMENT_HEADER):
+        headers.append(frame[offset:offset + header.size])
+        offset += header.size
+    return _format_frame(headers, frame[offset:])
+
+@functools.lru_cache(maxsize=1)
+def get_mac_address():
+    return uuid.getnode().to_bytes(6, 'big')
+
+@functools.lru_cache(maxsize=1)
+def get_my_ip():
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        s.connect(('10.255.255.255', 1))
+        my_ip = s.getsockname()[0]
+    except:
+        my_ip = '127.0.0.1'
+    finally:
+        s.close()
+    return my_ip
+
 class MockNetwork:
+    __slots__ = ('queue',)
+
     def __init__(self):
-        self.queue = queue.Queue()
+        # deque.append/popleft are atomic, but receive() does not block: popleft()
+        # raises IndexError when nothing has been sent yet, so a threaded receiver
+        # would have to poll (or switch back to queue.Queue for a blocking get).
+        self.queue = collections.deque()
 
     def send(self, data):
-        print_layer("Physical Layer", f"⬇️ Sending data:\n{data}")
-        self.queue.put(data)
+        if _DEBUG:
+            print_layer("Physical Layer", f"⬇️ Sending data:\n{_format_raw_frame(data)}")
+        self.queue.append(data)
 
     def receive(self):
-        data = self.queue.get()
-        print_layer("Physical Layer", f"⬆️ Received data:\n{data}")
+        data = self.queue.popleft()
+        if _DEBUG:
+            print_layer("Physical Layer", f"⬆️ Received data:\n{_format_raw_frame(data)}")
         return data
 
 class PhysicalLayer:
+    __slots__ = ('network',)
+
     def __init__(self, network):
         self.network = network
-        print_layer("Physical Layer", "✅ Initialized")
+        if _DEBUG:
+            print_layer("Physical Layer", "✅ Initialized")
 
-    def send(self, data):
-        self.network.send(data)
+    def send(self, data, headers=()):
+        self.network.send(b"".join((*headers, data)))
 
     def receive(self):
         return self.network.receive()
 
 class DataLinkLayer:
+    __slots__ = ('physical_layer', 'mac_address', '_prefix')
+
     def __init__(self, physical_layer):
         self.physical_layer = physical_layer
-        self.mac_address = self.get_mac_address()
-        print_layer("Data Link Layer", f"✅ Initialized with MAC: {self.mac_address}")
-
-    def get_mac_address(self):
-        mac = uuid.getnode()
-        mac_str = ':'.join(('%012X' % mac)[i:i+2] for i in range(0, 12, 2))
-        return mac_str
+        self.mac_address = get_mac_address()
+        self._prefix = MAC_HEADER.pack(self.mac_address)
+        if _DEBUG:
+            print_layer("Data Link Layer", f"✅ Initialized with MAC: {self.mac_address.hex(':').upper()}")
 
-    def send(self, data):
-        frame = f"{self.mac_address}|{data}"
-        print_layer("Data Link Layer", f"📦 Framing data:\n{frame}")
-        self.physical_layer.send(frame)
+    def send(self, data, headers=()):
+        headers = (self._prefix, *headers)
+        if _DEBUG:
+            print_layer("Data Link Layer", f"📦 Framing data:\n{_format_frame(headers, data)}")
+        self.physical_layer.send(data, headers)
 
     def receive(self):
-        data = self.physical_layer.receive()
-        return data.split("|", 1)[1] if "|" in data else data
+        data = memoryview(self.physical_layer.receive())
+        return data[MAC_HEADER.size:]
 
 class NetworkLayer:
+    __slots__ = ('data_link_layer', 'source_ip', 'destination_ip', '_prefix')
+
     def __init__(self, data_link_layer):
         self.data_link_layer = data_link_layer
-        self.source_ip = self.get_my_ip()
+        self.source_ip = get_my_ip()
         self.destination_ip = "192.168.1.100"
-        print_layer("Network Layer", f"✅ Initialized with IP: {self.source_ip} → {self.destination_ip}")
-
-    def get_my_ip(self):
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        try:
-            s.connect(('10.255.255.255', 1))
-            my_ip = s.getsockname()[0]
-        except:
-            my_ip = '127.0.0.1'
-        finally:
-            s.close()
-        return my_ip
+        self._prefix = IP_HEADER.pack(socket.inet_aton(self.source_ip), socket.inet_aton(self.destination_ip))
+        if _DEBUG:
+            print_layer("Network Layer", f"✅ Initialized with IP: {self.source_ip} → {self.destination_ip}")
 
-    def send(self, data):
-        packet = f"{self.source_ip}>{self.destination_ip}|{data}"
-        print_layer("Network Layer", f"🌍 Routing packet:\n{packet}")
-        self.data_link_layer.send(packet)
+    def send(self, data, headers=()):
+        headers = (self._prefix, *headers)
+        if _DEBUG:
+            print_layer("Network Layer", f"🌍 Routing packet:\n{_format_frame(headers, data)}")
+        self.data_link_layer.send(data, headers)
 
     def receive(self):
         data = self.data_link_layer.receive()
-        if "|" in data:
-            ip_info, payload = data.split("|", 1)
-            print_layer("Network Layer", f"📍 Packet info: {ip_info}")
-            return payload
-        return data
+        source_ip, destination_ip = IP_HEADER.unpack_from(data)
+        if _DEBUG:
+            print_layer("Network Layer", f"📍 Packet info: {socket.inet_ntoa(source_ip)}>{socket.inet_ntoa(destination_ip)}")
+        return data[IP_HEADER.size:]
 
 class TransportLayer:
+    __slots__ = ('network_layer', 'sequence')
+
     def __init__(self, network_layer):
         self.network_layer = network_layer
-        print_layer("Transport Layer", "✅ Initialized")
+        self.sequence = 0
+        if _DEBUG:
+            print_layer("Transport Layer", "✅ Initialized")
 
-    def send(self, data):
-        segment = f"SEQ_HEADER|{data}"
-        print_layer("Transport Layer", f"📜 Adding sequencing:\n{segment}")
-        self.network_layer.send(segment)
+    def next_sequence(self):
+        self.sequence += 1
+        return self.sequence
+
+    def send(self, data, headers=()):
+        headers = (SEGMENT_HEADER.pack(self.next_sequence(), len(data)), *headers)
+        if _DEBUG:
+            print_layer("Transport Layer", f"📜 Adding sequencing:\n{_format_frame(headers, data)}")
+        self.network_layer.send(data, headers)
 
     def receive(self):
         data = self.network_layer.receive()
-        return data.split("|", 1)[1] if "|" in data else data
+        sequence, length = SEGMENT_HEADER.unpack_from(data)
+        payload = data[SEGMENT_HEADER.size:]
+        if len(payload) != length:
+            raise ValueError(f"Segment {sequence} carries {len(payload)} bytes, header says {length}")
+        return payload
 
 class SessionLayer:
+    __slots__ = ('transport_layer', 'session_active')
+
     def __init__(self, transport_layer):
         self.transport_layer = transport_layer
         self.session_active = False
-        print_layer("Session Layer", "✅ Initialized")
+        if _DEBUG:
+            print_layer("Session Layer", "✅ Initialized")
 
     def start_session(self):
         self.session_active = True
-        print_layer("Session Layer", "🔄 Session started")
+        if _DEBUG:
+            print_layer("Session Layer", "🔄 Session started")
 
     def send(self, data):
         if self.session_active:
@@ -148,44 +224,58 @@ class SessionLayer:
             return self.transport_layer.receive()
 
 class PresentationLayer:
+    __slots__ = ('session_layer',)
+
     def __init__(self, session_layer):
         self.session_layer = session_layer
-        print_layer("Presentation Layer", "✅ Initialized")
+        if _DEBUG:
+            print_layer("Presentation Layer", "✅ Initialized")
 
     def send(self, data):
-        encoded_data = base64.b64encode(data.encode()).decode()
-        print_layer("Presentation Layer", f"🔐 Encoding data:\n{encoded_data}")
+        encoded_data = _b64encode(data)
+        if _DEBUG:
+            print_layer("Presentation Layer", f"🔐 Encoding data:\n{encoded_data.decode('ascii')}")
         self.session_layer.send(encoded_data)
 
     def receive(self):
         data = self.session_layer.receive()
-        if data.startswith("CONFIRMATION|"):
-            return data.split("|", 1)[1]
-        decoded_data = base64.b64decode(data).decode()
-        print_layer("Presentation Layer", f"🔓 Decoded data:\n{decoded_data}")
+        if data is None:
+            return None
+        if data[:_CONF_LEN] == _CONF_PREFIX:
+            return bytes(data[_CONF_LEN:]).decode()
+        decoded_data = _b64decode(data).decode()
+        if _DEBUG:
+            print_layer("Presentation Layer", f"🔓 Decoded data:\n{decoded_data}")
         return decoded_data
 
 class ApplicationLayer:
+    __slots__ = ('presentation_layer',)
+
     def __init__(self, presentation_layer):
         self.presentation_layer = presentation_layer
-        print_layer("Application Layer", "✅ Initialized")
+        if _DEBUG:
+            print_layer("Application Layer", "✅ Initialized")
 
     def place_order(self, customer, food, quantity, address):
-        order = json.dumps({
+        order = {
             "customer": customer,
             "food": food,
             "quantity": quantity,
             "address": address
-        }, indent=4)
-        print_layer("Application Layer", f"🛒 Placing order:\n{order}")
-        self.presentation_layer.send(order)
+        }
+        if _DEBUG:
+            print_layer("Application Layer", f"🛒 Placing order:\n{json.dumps(order, indent=4)}")
+        self.presentation_layer.send(_dumps(order))
 
     def receive_confirmation(self):
         confirmation = self.presentation_layer.receive()
         if confirmation:
             print_layer("Application Layer", f"✅ Order confirmed:\n{confirmation}")
+        return confirmation
 
 if __name__ == "__main__":
+    _DEBUG = True
+
     print("\n=================== 🍽️ Starting Food Ordering System (Mocked Network) ===================\n")
 
     network = MockNetwork()
@@ -199,11 +289,15 @@ if __name__ == "__main__":
 
     session.start_session()
     application.place_order("Al Glenrey", "Pizza", 2, "University of the Philippines Cebu, Lahug, Cebu City")
-    time.sleep(1)
 
     # Simulate confirmation coming from server (for demo purposes)
-    encoded_confirmation = base64.b64encode("CONFIRMATION|Order received, preparing Pizza!".encode()).decode()
-    network.send(f"SERVER_MAC|192.168.1.100>{network_layer.source_ip}|SEQ_HEADER|{encoded_confirmation}")
+    encoded_confirmation = _b64encode("CONFIRMATION|Order received, preparing Pizza!".encode())
+    network.send(b"".join((
+        MAC_HEADER.pack(b"SERVER"),
+        IP_HEADER.pack(socket.inet_aton("192.168.1.100"), socket.inet_aton(network_layer.source_ip)),
+        SEGMENT_HEADER.pack(1, len(encoded_confirmation)),
+        encoded_confirmation
+    )))
 
     application.receive_confirmation()
 